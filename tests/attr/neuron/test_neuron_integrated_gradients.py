@@ -3,7 +3,7 @@
 # pyre-unsafe
 
 import unittest
-from typing import Any, Callable, Tuple, Union
+from typing import Any, Callable, Dict, Tuple, Union
 
 import torch
 from captum._utils.typing import TensorLikeList, TensorOrTupleOfTensorsGeneric
@@ -166,14 +166,23 @@ class Test(BaseTest):
         test_input: Tensor,
         baseline: Union[None, Tensor] = None,
     ) -> None:
-        out = model(test_input)
+        with torch.no_grad():
+            out = model(test_input)
         input_attrib = IntegratedGradients(model)
         ig_attrib = NeuronIntegratedGradients(model, output_layer)
         for i in range(out.shape[1]):
+            # Keep the default integration method for the first target and
+            # use a cheaper approximation for the rest; both sides share the
+            # same path, so they match regardless of the method.
+            attr_kwargs: Dict[str, Any] = (
+                {} if i == 0 else {"n_steps": 20, "method": "riemann_right"}
+            )
             ig_vals = input_attrib.attribute(  # type: ignore[has-type]
-                test_input, target=i, baselines=baseline
+                test_input, target=i, baselines=baseline, **attr_kwargs
+            )
+            neuron_ig_vals = ig_attrib.attribute(
+                test_input, (i,), baselines=baseline, **attr_kwargs
             )
-            neuron_ig_vals = ig_attrib.attribute(test_input, (i,), baselines=baseline)
             assertTensorAlmostEqual(
                 self, ig_vals, neuron_ig_vals, delta=0.001, mode="max"
             )